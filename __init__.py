@@ -3,9 +3,10 @@ ComfyUI-KikoStats: Real-time monitoring and statistics for ComfyUI
 All nodes are grouped under the "ComfyAssets" category
 """
 
+import asyncio
+import functools
 import os
-import re
-from pathlib import Path
+import sys
 
 try:
     from .kikostats import NODE_CLASS_MAPPINGS, NODE_DISPLAY_NAME_MAPPINGS
@@ -16,14 +17,37 @@ except ImportError:
 # Tell ComfyUI where to find our JavaScript extensions
 WEB_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "web")
 
+# Console log prefixes
+_OK = "\033[92m[KikoStats]"
+_WARN = "\033[93m[KikoStats]"
+_INFO = "\033[94m"
+_RESET = "\033[0m"
 
+@functools.cache
 def get_version():
-    """Parse version from pyproject.toml"""
+    """Parse version from pyproject.toml (read once, then cached)"""
     try:
-        pyproject_path = Path(__file__).parent / "pyproject.toml"
-        if pyproject_path.exists():
-            content = pyproject_path.read_text()
-            match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
+        import tomllib
+    except ImportError:  # Python < 3.11
+        try:
+            import tomli as tomllib
+        except ImportError:
+            tomllib = None
+
+    try:
+        pyproject_path = os.path.join(os.path.dirname(__file__), "pyproject.toml")
+        if os.path.exists(pyproject_path):
+            with open(pyproject_path, "rb") as f:
+                if tomllib is not None:
+                    return tomllib.load(f)["project"]["version"]
+                content = f.read().decode("utf-8")
+
+            # No TOML parser (Python 3.10 without tomli): match the version line
+            import re
+
+            match = re.search(
+                r'^version\s*=\s*["\']([^"\']+)["\']', content, re.MULTILINE
+            )
             if match:
                 return match.group(1)
     except Exception:
@@ -31,72 +55,106 @@ def get_version():
     return "unknown"
 
 
-# Start continuous monitoring when ComfyUI loads
-try:
+@functools.lru_cache(maxsize=1)
+def _monitor():
+    """Start the continuous monitor on first use and publish it on the PromptServer"""
     from .kikostats.tools.resource_monitor.logic import get_global_monitor
 
-    # Initialize the global monitor (starts automatically)
     monitor = get_global_monitor()
 
-    # Make monitor available globally for JavaScript access
-    import sys
-
     if "server" in sys.modules:
-        # Store reference for web access
         import server
 
         if hasattr(server, "PromptServer") and hasattr(server.PromptServer, "instance"):
+            # Store reference for web access
             server.PromptServer.instance.kikostats_monitor = monitor
+            server.PromptServer.instance.kikostats_monitor_id = id(monitor)
+
+    return monitor
+
+
+# Continuous monitoring is deferred until the frontend asks for it (or a
+# workflow runs), so ComfyUI startup does not probe GPU/system hardware
+try:
+    if "server" in sys.modules:
+        import server
 
-            # Add a simple route to expose monitor to JavaScript
+        if hasattr(server, "PromptServer") and hasattr(server.PromptServer, "instance"):
+            # Routes exposing monitor state; the UI also uses /kikostats/monitor
+            # to wake the monitor when a node is created
             try:
-                from aiohttp import web
-
-                async def get_monitor_reference(request):
-                    # This is a hack to expose Python object to JavaScript
-                    return web.Response(
-                        text="window.kikoStatsGlobalMonitor = "
-                        + str(id(monitor))
-                        + ";",
-                        content_type="application/javascript",
+                routes = server.PromptServer.instance.routes
+
+                @routes.get("/kikostats/monitor")
+                async def get_monitor_stats(request):
+                    from aiohttp import web
+
+                    from .kikostats.tools.resource_monitor.logic import waiting_payload
+
+                    # The first request starts the monitor before any snapshot
+                    # exists; answer with the same waiting payload as the node
+                    return web.json_response(
+                        _monitor().get_latest_stats() or waiting_payload(),
+                        headers={"Cache-Control": "no-store"},
                     )
 
-                # Don't actually add route - just store reference for JS access
-                server.PromptServer.instance.kikostats_monitor_id = id(monitor)
+                @routes.get("/kikostats/stream")
+                async def stream_monitor_stats(request):
+                    # Server-sent events: clients subscribe once instead of polling
+                    from aiohttp import web
+
+                    monitor = _monitor()
+                    response = web.StreamResponse(
+                        headers={
+                            "Content-Type": "text/event-stream",
+                            "Cache-Control": "no-store",
+                        }
+                    )
+                    await response.prepare(request)
+
+                    last_payload = None
+                    try:
+                        while True:
+                            # Encoded once per snapshot and shared by all clients
+                            payload = monitor.get_latest_json(indent=False)
+                            if payload is not None and payload is not last_payload:
+                                last_payload = payload
+                                await response.write(
+                                    b"data: " + payload.encode() + b"\n\n"
+                                )
+                            await asyncio.sleep(monitor.update_interval)
+                    except ConnectionResetError:
+                        pass
+                    return response
 
             except Exception as e:
-                print(f"[KikoStats] Could not set up monitor access: {e}")
-                pass
+                print(_WARN, "Could not set up monitor access:", e, _RESET)
 
     # Install execution hooks for per-node tracking
     try:
         from .kikostats.execution_hooks import install_execution_hooks
 
         if install_execution_hooks():
-            print(
-                "\033[92m[KikoStats] Execution hooks installed for per-node tracking\033[0m"
-            )
+            print(_OK, "Execution hooks installed for per-node tracking", _RESET)
         else:
             print(
-                "\033[93m[KikoStats] Could not install execution hooks - per-node tracking disabled\033[0m"
+                _WARN,
+                "Could not install execution hooks - per-node tracking disabled",
+                _RESET,
             )
     except Exception as e:
-        print(f"\033[93m[KikoStats] Execution hooks error: {e}\033[0m")
+        print(_WARN, "Execution hooks error:", e, _RESET)
 
-    print(
-        "\033[92m[KikoStats] Continuous monitoring initialized on ComfyUI startup\033[0m"
-    )
+    print(_OK, "Continuous monitoring will start on first use", _RESET)
 except Exception as e:
-    print(
-        f"\033[93m[KikoStats] Warning: Could not start continuous monitoring: {e}\033[0m"
-    )
+    print(_WARN, "Warning: Could not set up continuous monitoring:", e, _RESET)
 
 # Print startup message with loaded tools
 print()  # Empty line before
-print(f"\033[94m[ComfyUI-KikoStats] Version:\033[0m {get_version()}")
+print(_INFO + "[ComfyUI-KikoStats] Version:" + _RESET, get_version())
 for node_key, display_name in NODE_DISPLAY_NAME_MAPPINGS.items():
-    print(f"🫶 \033[94mLoaded:\033[0m {display_name}")
-print(f"\033[94mTotal: {len(NODE_CLASS_MAPPINGS)} monitoring tools loaded\033[0m")
+    print("🫶 " + _INFO + "Loaded:" + _RESET, display_name)
+print(_INFO + "Total:", len(NODE_CLASS_MAPPINGS), "monitoring tools loaded" + _RESET)
 print()  # Empty line after
 
 __all__ = ["NODE_CLASS_MAPPINGS", "NODE_DISPLAY_NAME_MAPPINGS", "WEB_DIRECTORY"]
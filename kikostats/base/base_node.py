@@ -22,6 +22,9 @@ class ComfyAssetsBaseNode:
 
     CATEGORY = "🫶 ComfyAssets/🛠️ Utils"
 
+    # No per-instance __dict__; subclasses declare their own __slots__
+    __slots__ = ()
+
     def validate_inputs(self, **kwargs) -> None:
         """
         Common input validation logic
@@ -3,69 +3,160 @@ ComfyUI Execution Hooks for Node-Level Resource Monitoring
 Integrates with ComfyUI's execution system to track per-node performance
 """
 
+import os
+import queue
+import sys
+import threading
 import time
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Dict, Any, Optional
 
+
+@dataclass(slots=True)
+class NodeCtx:
+    """Per-node execution context captured when a node starts"""
+    type: str
+    title: str
+    t0_ns: int
+
+
+# Console log prefix
+_PREFIX = "[KikoStats]"
+
 # Global state for tracking
-_node_tracking_data = {}
-_current_node_info = {}
+# Node contexts live in a per-prompt map so concurrent prompts don't share state
+_NODE_CTX: ContextVar[Optional[Dict[str, NodeCtx]]] = ContextVar("kikostats_nodes", default=None)
+
+# Global continuous monitor, bound on first use so ComfyUI startup stays cheap
+_MON = None
+
+# Node types that finish in microseconds; these only get wall-clock timing,
+# not full resource sampling
+_CHEAP_TYPES = frozenset({"Reroute", "PrimitiveNode", "Note", "GetNode", "SetNode"})
+
+# Per-node log lines are only emitted when KIKOSTATS_VERBOSE is set; they are
+# queued by the hooks and written in batches by a background thread
+_VERBOSE = bool(os.environ.get("KIKOSTATS_VERBOSE"))
+_LOG_BATCH_SIZE = 50
+_LOG_BATCH_WAIT = 0.1
+_log_q: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+
+def _log_writer():
+    """Drain queued hook messages and write them to stdout in batches"""
+    while True:
+        batch = [_log_q.get()]
+        deadline = time.monotonic() + _LOG_BATCH_WAIT
+        while len(batch) < _LOG_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_log_q.get(timeout=remaining))
+            except queue.Empty:
+                break
+        sys.stdout.write("\n".join(batch) + "\n")
+        sys.stdout.flush()
+
+def _log(message: str):
+    """Queue a per-node log message; callers check _VERBOSE before formatting"""
+    _log_q.put_nowait(message)
+
+if _VERBOSE:
+    threading.Thread(target=_log_writer, name="kikostats-log", daemon=True).start()
+
+def _node_info() -> Dict[str, NodeCtx]:
+    """Node context map for the prompt executing in the current context"""
+    nodes = _NODE_CTX.get()
+    if nodes is None:
+        nodes = {}
+        _NODE_CTX.set(nodes)
+    return nodes
 
 def get_node_info_from_prompt(prompt_id: str, node_id: str) -> Dict[str, str]:
     """Extract node information from the current execution context"""
     # In a real implementation, this would extract from ComfyUI's execution context
     # For now, return basic info
-    return {
-        'node_type': _current_node_info.get(node_id, {}).get('type', 'Unknown'),
-        'node_title': _current_node_info.get(node_id, {}).get('title', f'Node {node_id}')
-    }
+    ctx = _node_info().get(node_id)
+    if ctx is None:
+        return {'node_type': 'Unknown', 'node_title': f'Node {node_id}'}
+    return {'node_type': ctx.type, 'node_title': ctx.title}
+
+def _bind_monitor():
+    """Bind the global continuous monitor to _MON (starts it on first call)"""
+    global _MON
+    from .tools.resource_monitor.logic import get_global_monitor
+    _MON = get_global_monitor()
+    return _MON
 
 def on_node_execution_start(prompt_id: str, node_id: str, node_data: Dict[str, Any]):
     """Called when a node starts executing"""
     try:
-        from .tools.resource_monitor.logic import get_global_monitor
-        
         # Store node info for later use
-        _current_node_info[node_id] = {
-            'type': node_data.get('class_type', 'Unknown'),
-            'title': node_data.get('_meta', {}).get('title', f'Node {node_id}')
-        }
+        node_type = node_data.get('class_type', 'Unknown')
+        _node_info()[node_id] = NodeCtx(
+            type=node_type,
+            title=node_data.get('_meta', {}).get('title', f'Node {node_id}'),
+            t0_ns=time.perf_counter_ns()
+        )
+        
+        # Trivially fast nodes are only timed
+        if node_type in _CHEAP_TYPES:
+            return
         
         # Get node information
         node_info = get_node_info_from_prompt(prompt_id, node_id)
         
         # Start tracking this node
-        monitor = get_global_monitor()
+        monitor = _MON or _bind_monitor()
         monitor.start_node_tracking(
             node_id=node_id,
             node_type=node_info['node_type'],
             node_title=node_info['node_title']
         )
         
-        print(f"[KikoStats] Started tracking execution: {node_info['node_title']} ({node_info['node_type']}) [{node_id}]")
+        if _VERBOSE:
+            _log(f"{_PREFIX} Started tracking execution: {node_info['node_title']} ({node_info['node_type']}) [{node_id}]")
         
     except Exception as e:
-        print(f"[KikoStats] Error starting node tracking: {e}")
+        print(_PREFIX, "Error starting node tracking:", e)
 
 def on_node_execution_end(prompt_id: str, node_id: str, output_data: Any):
     """Called when a node finishes executing"""
     try:
-        from .tools.resource_monitor.logic import get_global_monitor
+        nodes = _node_info()
+        ctx = nodes.get(node_id)
+        dur_ns = time.perf_counter_ns() - ctx.t0_ns if ctx is not None else None
+        
+        # Trivially fast nodes only report their duration
+        if ctx is not None and ctx.type in _CHEAP_TYPES:
+            nodes.pop(node_id, None)
+            if _VERBOSE:
+                _log(f"{_PREFIX} Completed: {ctx.title} ({dur_ns / 1e6:.3f}ms, not sampled)")
+            return
         
         # Stop tracking this node
-        monitor = get_global_monitor()
-        metrics = monitor.stop_node_tracking(node_id)
+        monitor = _MON or _bind_monitor()
+        metrics = monitor.stop_node_tracking(node_id, dur_ns=dur_ns)
         
-        if metrics:
-            print(f"[KikoStats] Completed tracking: {metrics['node_title']} "
-                  f"({metrics['duration_ms']:.1f}ms, "
-                  f"CPU: {metrics['avg_cpu_percent']:.1f}%, "
-                  f"GPU: {metrics['avg_gpu_utilization']:.1f}%)")
+        if metrics and _VERBOSE:
+            _log(f"{_PREFIX} Completed tracking: {metrics['node_title']} "
+                 f"({metrics['duration_ms']:.1f}ms, "
+                 f"CPU: {metrics['avg_cpu_percent']:.1f}%, "
+                 f"GPU: {metrics['avg_gpu_utilization']:.1f}%)")
         
         # Clean up node info
-        _current_node_info.pop(node_id, None)
+        nodes.pop(node_id, None)
         
     except Exception as e:
-        print(f"[KikoStats] Error stopping node tracking: {e}")
+        print(_PREFIX, "Error stopping node tracking:", e)
+
+def _get_node_data(dynprompt: Any, node_id: str) -> Dict[str, Any]:
+    """Look up a node's prompt entry from ComfyUI's DynamicPrompt"""
+    try:
+        return dynprompt.get_node(node_id)
+    except Exception:
+        return {}
 
 def install_execution_hooks():
     """Install execution hooks into ComfyUI's execution system"""
@@ -76,65 +167,70 @@ def install_execution_hooks():
         
         # Store original methods
         if hasattr(execution, 'PromptExecutor'):
+            # Already installed (e.g. custom nodes were reloaded) - don't stack wrappers
+            if getattr(execution.PromptExecutor.execute, '_kikostats_wrapped', False):
+                return True
+            
             original_execute = execution.PromptExecutor.execute
             
             def wrapped_execute(self, prompt, prompt_id, extra_data={}, execute_outputs=[]):
-                """Wrapped execute method that tracks nodes"""
+                """Wrapped execute method that reports total workflow time"""
                 
                 # Track total workflow execution time
                 workflow_start_time = time.time()
                 
-                # Store original methods for node execution
-                if hasattr(self, 'execute_node'):
-                    original_execute_node = self.execute_node
-                    
-                    def wrapped_execute_node(node, current_item, prompt_id, dynprompt):
-                        """Wrapped node execution"""
-                        node_id = str(current_item)
-                        
-                        # Get node data
-                        node_data = prompt.get(node_id, {})
-                        
-                        # Start tracking
-                        on_node_execution_start(prompt_id, node_id, node_data)
-                        
-                        try:
-                            # Execute the node
-                            result = original_execute_node(node, current_item, prompt_id, dynprompt)
-                            return result
-                        finally:
-                            # Stop tracking
-                            on_node_execution_end(prompt_id, node_id, None)
-                    
-                    # Replace the method temporarily
-                    self.execute_node = wrapped_execute_node
+                # Give this prompt its own node context map
+                token = _NODE_CTX.set({})
                 
                 # Call original execute
                 try:
                     result = original_execute(self, prompt, prompt_id, extra_data, execute_outputs)
                     return result
                 finally:
+                    _NODE_CTX.reset(token)
+                    
                     # Calculate total workflow execution time
                     workflow_end_time = time.time()
                     total_execution_time = workflow_end_time - workflow_start_time
                     
                     # Send workflow completion event with execution time
                     try:
-                        from .tools.resource_monitor.logic import get_global_monitor
-                        monitor = get_global_monitor()
+                        monitor = _MON or _bind_monitor()
                         if hasattr(monitor, 'send_workflow_complete'):
                             monitor.send_workflow_complete(total_execution_time)
                     except Exception as e:
-                        print(f"[KikoStats] Error sending workflow complete event: {e}")
+                        print(_PREFIX, "Error sending workflow complete event:", e)
+            
+            # Wrap node execution once at class level instead of per execute()
+            if hasattr(execution.PromptExecutor, 'execute_node'):
+                original_execute_node = execution.PromptExecutor.execute_node
+                
+                def wrapped_execute_node(self, node, current_item, prompt_id, dynprompt):
+                    """Wrapped node execution"""
+                    node_id = str(current_item)
+                    
+                    # Start tracking
+                    on_node_execution_start(prompt_id, node_id, _get_node_data(dynprompt, node_id))
+                    
+                    try:
+                        # Execute the node
+                        return original_execute_node(self, node, current_item, prompt_id, dynprompt)
+                    finally:
+                        # Stop tracking
+                        on_node_execution_end(prompt_id, node_id, None)
+                
+                wrapped_execute_node._kikostats_wrapped = True
+                execution.PromptExecutor.execute_node = wrapped_execute_node
             
             # Replace the method
+            wrapped_execute._kikostats_wrapped = True
             execution.PromptExecutor.execute = wrapped_execute
             
-            print("[KikoStats] Successfully installed execution hooks")
+            print(_PREFIX, "Successfully installed execution hooks")
             return True
             
     except Exception as e:
-        print(f"[KikoStats] Could not install execution hooks: {e}")
+        print(_PREFIX, "Could not install execution hooks:", e)
         return False
     
     return False
\ No newline at end of file
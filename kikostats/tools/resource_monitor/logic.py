@@ -3,12 +3,25 @@ Core monitoring logic for Resource Monitor
 Handles GPU and system resource data collection
 """
 
+import atexit
+import functools
+import json
+import logging
+import os
 import time
 import threading
 import asyncio
-from typing import Dict, Any, Optional, Tuple
+from array import array
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from itertools import islice
+
+logger = logging.getLogger("kikostats")
+
+# Consecutive monitor loop errors logged with a traceback before the rest
+# of the streak is suppressed
+MAX_LOGGED_MONITOR_ERRORS = 3
 
 # Try to import monitoring libraries with graceful fallbacks
 try:
@@ -25,6 +38,14 @@ except ImportError:
     PSUTIL_AVAILABLE = False
     psutil = None
 
+# Optional faster JSON encoder for the node's JSON output
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 # Try to import ComfyUI server for WebSocket communication
 try:
     from server import PromptServer
@@ -34,7 +55,11 @@ except ImportError:
     PromptServer = None
 
 
-@dataclass
+# Completed node metrics retained by NodeResourceTracker
+MAX_COMPLETED_NODES = 50
+
+
+@dataclass(slots=True)
 class GPUStats:
     """GPU monitoring statistics"""
     utilization: int  # GPU utilization percentage (0-100)
@@ -46,7 +71,7 @@ class GPUStats:
     available: bool = True  # Whether GPU monitoring is available
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemStats:
     """System resource statistics"""
     cpu_percent: float  # CPU usage percentage
@@ -56,7 +81,7 @@ class SystemStats:
     available: bool = True  # Whether system monitoring is available
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeResourceSample:
     """Single resource measurement for a node"""
     timestamp: float
@@ -66,7 +91,7 @@ class NodeResourceSample:
     vram_delta: int  # Change in VRAM usage since last sample
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeResourceMetrics:
     """Aggregated resource metrics for a node"""
     node_id: str
@@ -74,7 +99,8 @@ class NodeResourceMetrics:
     node_title: str = ""
     start_time: float = 0.0
     end_time: float = 0.0
-    duration_ms: float = 0.0
+    start_ns: int = 0  # perf_counter_ns() at start, used for duration
+    duration_ns: int = 0
     
     # CPU metrics
     avg_cpu_percent: float = 0.0
@@ -86,31 +112,143 @@ class NodeResourceMetrics:
     peak_vram_used: int = 0
     vram_delta: int = 0  # Net VRAM change during execution
     
-    # Sample data
-    samples: list = field(default_factory=list)
+    # Number of samples folded into the aggregates (raw samples aren't kept)
+    sample_count: int = 0
+    
+    # Running totals maintained by add_sample, replaced as one tuple so a
+    # concurrent calculate_aggregates() always reads a consistent set:
+    # (count, sum_cpu, sum_gpu, max_cpu, max_gpu, peak_vram, first_vram, last_vram)
+    _totals: Tuple[int, float, int, float, int, int, int, int] = field(
+        default=(0, 0.0, 0, 0.0, 0, 0, 0, 0), init=False, repr=False
+    )
+    
+    @property
+    def duration_ms(self) -> float:
+        """Execution duration in milliseconds (derived from duration_ns)"""
+        return self.duration_ns / 1e6
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary of the aggregated metrics for JSON serialization"""
+        return {
+            'node_id': self.node_id,
+            'node_type': self.node_type,
+            'node_title': self.node_title,
+            'duration_ms': self.duration_ms,
+            'avg_cpu_percent': self.avg_cpu_percent,
+            'max_cpu_percent': self.max_cpu_percent,
+            'avg_gpu_utilization': self.avg_gpu_utilization,
+            'max_gpu_utilization': self.max_gpu_utilization,
+            'peak_vram_used': self.peak_vram_used,
+            'vram_delta': self.vram_delta,
+            'sample_count': self.sample_count
+        }
+    
+    def add_sample(self, sample: NodeResourceSample):
+        """
+        Fold a sample into the running totals
+        
+        Only the monitor thread adds samples; the public aggregate fields
+        are written by calculate_aggregates() when the node is finalized.
+        """
+        count, sum_cpu, sum_gpu, max_cpu, max_gpu, peak_vram, first_vram, _ = self._totals
+        cpu = sample.cpu_percent
+        gpu = sample.gpu_utilization
+        vram = sample.gpu_memory_used
+        self._totals = (
+            count + 1,
+            sum_cpu + cpu,
+            sum_gpu + gpu,
+            cpu if cpu > max_cpu else max_cpu,
+            gpu if gpu > max_gpu else max_gpu,
+            vram if vram > peak_vram else peak_vram,
+            first_vram if count else vram,
+            vram,
+        )
     
     def calculate_aggregates(self):
-        """Calculate aggregate metrics from samples"""
-        if not self.samples:
+        """Calculate aggregate metrics from one read of the running totals"""
+        count, sum_cpu, sum_gpu, max_cpu, max_gpu, peak_vram, first_vram, last_vram = self._totals
+        if not count:
             return
-            
-        self.duration_ms = (self.end_time - self.start_time) * 1000
-        
-        cpu_values = [s.cpu_percent for s in self.samples]
-        gpu_values = [s.gpu_utilization for s in self.samples]
-        vram_values = [s.gpu_memory_used for s in self.samples]
-        
-        self.avg_cpu_percent = sum(cpu_values) / len(cpu_values) if cpu_values else 0
-        self.max_cpu_percent = max(cpu_values) if cpu_values else 0
         
-        self.avg_gpu_utilization = sum(gpu_values) / len(gpu_values) if gpu_values else 0
-        self.max_gpu_utilization = max(gpu_values) if gpu_values else 0
-        
-        self.peak_vram_used = max(vram_values) if vram_values else 0
+        self.sample_count = count
+        self.avg_cpu_percent = sum_cpu / count
+        self.max_cpu_percent = max_cpu
+        self.avg_gpu_utilization = sum_gpu / count
+        self.max_gpu_utilization = max_gpu
+        self.peak_vram_used = peak_vram
         
         # Calculate net VRAM change
-        if len(self.samples) >= 2:
-            self.vram_delta = self.samples[-1].gpu_memory_used - self.samples[0].gpu_memory_used
+        if count >= 2:
+            self.vram_delta = last_vram - first_vram
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment, falling back to default"""
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# Short-lived caches so readers polling within the same tick (the monitor
+# loop and node tracking baselines) share a single NVML/psutil query
+GPU_STATS_CACHE_TTL = _env_float("KIKOSTATS_GPU_CACHE_TTL", 0.4)
+SYSTEM_STATS_CACHE_TTL = _env_float("KIKOSTATS_SYSTEM_CACHE_TTL", 0.2)
+# Per-device last reading: device_index -> (monotonic time, stats)
+_GPU_STATS_CACHE: Dict[int, Tuple[float, GPUStats]] = {}
+_LAST_SYSTEM_STATS: Tuple[float, Optional[SystemStats]] = (0.0, None)
+
+# NVML is initialized once per process; device handles are cached per index
+_NVML_INITIALIZED = False
+_NVML_INIT_LOCK = threading.Lock()
+_NVML_HANDLE_CACHE: Dict[int, Any] = {}
+_NVML_DEVICE_COUNT: Optional[int] = None
+# device_index -> names of metrics NVML reports as not supported
+_NVML_UNSUPPORTED: Dict[int, set] = {}
+
+
+def _ensure_nvml() -> None:
+    """Initialize NVML on first use and register its shutdown at exit"""
+    global _NVML_INITIALIZED
+    with _NVML_INIT_LOCK:
+        if not _NVML_INITIALIZED:
+            pynvml.nvmlInit()
+            _NVML_INITIALIZED = True
+            atexit.register(_shutdown_nvml)
+
+
+def _shutdown_nvml() -> None:
+    """Release NVML and drop cached device handles"""
+    global _NVML_INITIALIZED, _NVML_DEVICE_COUNT
+    with _NVML_INIT_LOCK:
+        if _NVML_INITIALIZED:
+            _NVML_HANDLE_CACHE.clear()
+            _NVML_UNSUPPORTED.clear()
+            _NVML_DEVICE_COUNT = None
+            _NVML_INITIALIZED = False
+            try:
+                pynvml.nvmlShutdown()
+            except Exception:
+                pass
+
+
+def _get_nvml_handle(device_index: int) -> Any:
+    """Get the NVML device handle for an index, resolving it only once"""
+    handle = _NVML_HANDLE_CACHE.get(device_index)
+    if handle is None:
+        handle = pynvml.nvmlDeviceGetHandleByIndex(device_index)
+        _NVML_HANDLE_CACHE[device_index] = handle
+    return handle
+
+
+def _get_device_count() -> int:
+    """Number of NVML devices, queried only once per NVML session"""
+    global _NVML_DEVICE_COUNT
+    if _NVML_DEVICE_COUNT is None:
+        _ensure_nvml()
+        _NVML_DEVICE_COUNT = pynvml.nvmlDeviceGetCount()
+    return _NVML_DEVICE_COUNT
 
 
 def initialize_gpu_monitoring() -> bool:
@@ -124,20 +262,43 @@ def initialize_gpu_monitoring() -> bool:
         return False
     
     try:
-        pynvml.nvmlInit()
         # Try to get device count to verify NVIDIA drivers are working
-        device_count = pynvml.nvmlDeviceGetCount()
-        return device_count > 0
+        return _get_device_count() > 0
     except Exception:
         return False
 
 
-def get_gpu_stats(device_index: int = 0) -> GPUStats:
+@functools.lru_cache(maxsize=1)
+def init_monitoring_backends() -> Tuple[bool, bool]:
+    """
+    Initialize NVML and prime psutil once for every monitor in the process
+    
+    Runs on first monitor construction rather than at import, so loading
+    the node does not probe hardware during ComfyUI startup.
+    
+    Returns:
+        Tuple of (gpu_available, system_available)
+    """
+    gpu_available = initialize_gpu_monitoring()
+    
+    # Prime CPU monitoring so the first non-blocking reading isn't 0%
+    if PSUTIL_AVAILABLE:
+        try:
+            psutil.cpu_percent(interval=None)
+        except Exception:
+            pass
+    
+    return gpu_available, PSUTIL_AVAILABLE
+
+
+def get_gpu_stats(device_index: int = 0, max_age: Optional[float] = None) -> GPUStats:
     """
     Get current GPU statistics using NVIDIA Management Library
     
     Args:
         device_index: GPU device index (default: 0 for primary GPU)
+        max_age: Oldest cached reading (seconds) the caller accepts; the
+            cache TTL is capped to this, e.g. half a monitor's interval
         
     Returns:
         GPUStats object with current GPU metrics
@@ -153,39 +314,138 @@ def get_gpu_stats(device_index: int = 0) -> GPUStats:
             available=False
         )
     
+    ttl = GPU_STATS_CACHE_TTL if max_age is None else min(GPU_STATS_CACHE_TTL, max_age)
+    now = time.monotonic()
+    cached = _GPU_STATS_CACHE.get(device_index)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+    
+    stats = _query_gpu_stats(device_index)
+    _GPU_STATS_CACHE[device_index] = (now, stats)
+    return stats
+
+
+def get_all_gpu_stats() -> List[GPUStats]:
+    """
+    Get current statistics for every NVIDIA GPU
+    
+    Returns:
+        List of GPUStats indexed by device; empty if GPU monitoring is unavailable
+    """
+    if not PYNVML_AVAILABLE:
+        return []
+    
     try:
-        # Ensure pynvml is initialized
-        pynvml.nvmlInit()
-        handle = pynvml.nvmlDeviceGetHandleByIndex(device_index)
+        device_count = _get_device_count()
+    except Exception:
+        return []
+    
+    return [get_gpu_stats(index) for index in range(device_count)]
+
+
+def _nvml_not_supported(exc: Exception) -> bool:
+    """Whether an NVML error means the metric is unsupported on the device"""
+    not_supported = getattr(pynvml, "NVMLError_NotSupported", None)
+    return not_supported is not None and isinstance(exc, not_supported)
+
+
+def _nvml_read_all(device_index: int, handle: Any) -> Tuple[int, int, int, int, int]:
+    """
+    Read utilization, memory, temperature and power for a device
+    
+    The four NVML queries are issued back to back under one handler while
+    the device has no known unsupported metric. Metrics that NVML reports
+    as not supported are remembered for the device and skipped, so cards
+    without e.g. power readings don't pay for a failed batch on every tick.
+    Other errors only zero the metric for the current read.
+    
+    Returns:
+        Tuple of (utilization %, memory used bytes, memory total bytes,
+        temperature C, power mW)
         
-        # Get GPU utilization
+    Raises:
+        RuntimeError: If no metric could be read
+    """
+    unsupported = _NVML_UNSUPPORTED.get(device_index)
+    if not unsupported:
         try:
-            util = pynvml.nvmlDeviceGetUtilizationRates(handle)
-            gpu_util = util.gpu
+            gpu_util = pynvml.nvmlDeviceGetUtilizationRates(handle).gpu
+            mem_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
+            temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+            power_mw = pynvml.nvmlDeviceGetPowerUsage(handle)
+            return gpu_util, mem_info.used, mem_info.total, temp, power_mw
         except Exception:
-            gpu_util = 0
-        
-        # Get memory info
+            # Find out which metric failed, one query at a time
+            unsupported = _NVML_UNSUPPORTED.setdefault(device_index, set())
+    return _nvml_read_each(handle, unsupported)
+
+
+def _nvml_read_each(handle: Any, unsupported: set) -> Tuple[int, int, int, int, int]:
+    """
+    Slow path of _nvml_read_all: query each metric with its own fallback
+    
+    Metrics listed in ``unsupported`` are skipped, and metrics that fail
+    with NVMLError_NotSupported are added to it.
+    """
+    gpu_util = mem_used = mem_total = temp = power_mw = 0
+    read_any = False
+    
+    # Get GPU utilization
+    if "utilization" not in unsupported:
+        try:
+            gpu_util = pynvml.nvmlDeviceGetUtilizationRates(handle).gpu
+            read_any = True
+        except Exception as e:
+            if _nvml_not_supported(e):
+                unsupported.add("utilization")
+    
+    # Get memory info
+    if "memory" not in unsupported:
         try:
             mem_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
-            memory_used = mem_info.used // (1024 * 1024)  # Convert to MB
-            memory_total = mem_info.total // (1024 * 1024)  # Convert to MB
-            memory_percent = (mem_info.used / mem_info.total) * 100
-        except Exception:
-            memory_used = memory_total = 0
-            memory_percent = 0.0
-        
-        # Get temperature
+            mem_used, mem_total = mem_info.used, mem_info.total
+            read_any = True
+        except Exception as e:
+            if _nvml_not_supported(e):
+                unsupported.add("memory")
+    
+    # Get temperature
+    if "temperature" not in unsupported:
         try:
             temp = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
-        except Exception:
-            temp = 0
-        
-        # Get power draw
+            read_any = True
+        except Exception as e:
+            if _nvml_not_supported(e):
+                unsupported.add("temperature")
+    
+    # Get power draw
+    if "power" not in unsupported:
         try:
-            power = pynvml.nvmlDeviceGetPowerUsage(handle) // 1000  # Convert to Watts
-        except Exception:
-            power = 0
+            power_mw = pynvml.nvmlDeviceGetPowerUsage(handle)
+            read_any = True
+        except Exception as e:
+            if _nvml_not_supported(e):
+                unsupported.add("power")
+    
+    if not read_any:
+        raise RuntimeError("No NVML metric could be read")
+    
+    return gpu_util, mem_used, mem_total, temp, power_mw
+
+
+def _query_gpu_stats(device_index: int) -> GPUStats:
+    """Query NVML for the current statistics of one device"""
+    try:
+        # Ensure pynvml is initialized (once) and reuse the device handle
+        if not _NVML_INITIALIZED:
+            _ensure_nvml()
+        handle = _get_nvml_handle(device_index)
+        
+        gpu_util, mem_used, mem_total, temp, power_mw = _nvml_read_all(device_index, handle)
+        memory_used = mem_used // (1024 * 1024)  # Convert to MB
+        memory_total = mem_total // (1024 * 1024)  # Convert to MB
+        memory_percent = (mem_used / mem_total) * 100 if mem_total else 0.0
+        power = power_mw // 1000  # Convert to Watts
         
         return GPUStats(
             utilization=gpu_util,
@@ -210,13 +470,19 @@ def get_gpu_stats(device_index: int = 0) -> GPUStats:
         )
 
 
-def get_system_stats() -> SystemStats:
+def get_system_stats(max_age: Optional[float] = None) -> SystemStats:
     """
     Get current system resource statistics using psutil
     
+    Args:
+        max_age: Oldest cached reading (seconds) the caller accepts; the
+            cache TTL is capped to this, e.g. half a monitor's interval
+    
     Returns:
         SystemStats object with current system metrics
     """
+    global _LAST_SYSTEM_STATS
+    
     if not PSUTIL_AVAILABLE:
         return SystemStats(
             cpu_percent=0.0,
@@ -226,6 +492,19 @@ def get_system_stats() -> SystemStats:
             available=False
         )
     
+    ttl = SYSTEM_STATS_CACHE_TTL if max_age is None else min(SYSTEM_STATS_CACHE_TTL, max_age)
+    now = time.monotonic()
+    cached_at, cached_stats = _LAST_SYSTEM_STATS
+    if cached_stats is not None and now - cached_at < ttl:
+        return cached_stats
+    
+    stats = _query_system_stats()
+    _LAST_SYSTEM_STATS = (now, stats)
+    return stats
+
+
+def _query_system_stats() -> SystemStats:
+    """Query psutil for the current system statistics"""
     try:
         # Get CPU usage (non-blocking, based on last call)
         cpu_percent = psutil.cpu_percent(interval=0)
@@ -254,10 +533,122 @@ def get_system_stats() -> SystemStats:
         )
 
 
+# Payload sections for a disabled/unavailable monitor. These are shared by
+# every snapshot that needs them, so they must never be mutated.
+UNAVAILABLE_GPU_PAYLOAD: Dict[str, Any] = {
+    "available": False,
+    "utilization": 0,
+    "memory_used": 0,
+    "memory_total": 0,
+    "memory_percent": 0.0,
+    "temperature": 0,
+    "power_draw": 0,
+}
+
+UNAVAILABLE_SYSTEM_PAYLOAD: Dict[str, Any] = {
+    "available": False,
+    "cpu_percent": 0.0,
+    "ram_used": 0,
+    "ram_total": 0,
+    "ram_percent": 0.0,
+}
+
+
+def gpu_payload(gpu_stats: Optional[GPUStats]) -> Dict[str, Any]:
+    """
+    Convert GPU stats to the "gpu" section of the JSON payload
+    
+    Args:
+        gpu_stats: Latest GPU stats, or None if GPU monitoring is off
+        
+    Returns:
+        Dictionary of GPU fields (the shared unavailable section for None)
+    """
+    if gpu_stats is None:
+        return UNAVAILABLE_GPU_PAYLOAD
+    return {
+        "available": gpu_stats.available,
+        "utilization": gpu_stats.utilization,
+        "memory_used": gpu_stats.memory_used,
+        "memory_total": gpu_stats.memory_total,
+        "memory_percent": gpu_stats.memory_percent,
+        "temperature": gpu_stats.temperature,
+        "power_draw": gpu_stats.power_draw,
+    }
+
+
+def system_payload(system_stats: Optional[SystemStats]) -> Dict[str, Any]:
+    """
+    Convert system stats to the "system" section of the JSON payload
+    
+    Args:
+        system_stats: Latest system stats, or None if system monitoring is off
+        
+    Returns:
+        Dictionary of system fields (the shared unavailable section for None)
+    """
+    if system_stats is None:
+        return UNAVAILABLE_SYSTEM_PAYLOAD
+    return {
+        "available": system_stats.available,
+        "cpu_percent": system_stats.cpu_percent,
+        "ram_used": system_stats.ram_used,
+        "ram_total": system_stats.ram_total,
+        "ram_percent": system_stats.ram_percent,
+    }
+
+
+# Payload served before the continuous monitor has published a snapshot;
+# the unavailable sections are shared read-only dicts
+_WAITING_PAYLOAD: Dict[str, Any] = {
+    "timestamp": 0.0,
+    "gpu": UNAVAILABLE_GPU_PAYLOAD,
+    "system": UNAVAILABLE_SYSTEM_PAYLOAD,
+}
+
+
+def waiting_payload() -> Dict[str, Any]:
+    """
+    Build the stats payload used while no snapshot exists yet
+    
+    Returns:
+        Shallow copy of the waiting payload with a fresh timestamp
+    """
+    payload = _WAITING_PAYLOAD.copy()
+    payload["timestamp"] = time.time()
+    return payload
+
+
+def dumps_stats(stats_dict: Dict[str, Any], indent: bool = True) -> str:
+    """
+    Encode a stats payload as JSON
+    
+    Uses orjson when it is installed and falls back to the json module.
+    
+    Args:
+        stats_dict: Payload built by the monitors
+        indent: Indent by 2 spaces (False for compact single-line JSON)
+        
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        if indent:
+            return orjson.dumps(stats_dict, option=orjson.OPT_INDENT_2).decode()
+        return orjson.dumps(stats_dict).decode()
+    if indent:
+        return json.dumps(stats_dict, indent=2)
+    return json.dumps(stats_dict)
+
+
 class ResourceMonitor:
     """
     Thread-safe resource monitoring class
     Collects GPU and system statistics in separate thread
+    
+    When the global continuous monitor is running, this subscribes to its
+    readings instead of polling NVML/psutil on a thread of its own (and
+    then follows the global monitor's update interval).
     """
     
     def __init__(self, update_interval: float = 1.0):
@@ -270,50 +661,65 @@ class ResourceMonitor:
         self.update_interval = update_interval
         self.monitoring = False
         self.monitor_thread: Optional[threading.Thread] = None
-        self.lock = threading.Lock()
+        self._subscribed_to: Optional["ContinuousResourceMonitor"] = None
         
-        # Latest stats
-        self.gpu_stats: Optional[GPUStats] = None
-        self.system_stats: Optional[SystemStats] = None
+        # Latest stats, published as one (gpu_stats, system_stats) tuple so
+        # readers always see a matching pair without taking a lock
+        self._snapshot: Tuple[Optional[GPUStats], Optional[SystemStats]] = (None, None)
         
         # Initialize monitoring capabilities
-        self.gpu_available = initialize_gpu_monitoring()
-        self.system_available = PSUTIL_AVAILABLE
+        self.gpu_available, self.system_available = init_monitoring_backends()
     
     def start_monitoring(self) -> None:
-        """Start monitoring in background thread"""
+        """Start monitoring (shared global readings, else a background thread)"""
         if self.monitoring:
             return
         
         self.monitoring = True
+        
+        # Reuse the global monitor's readings rather than polling twice
+        global_monitor = _global_monitor
+        if global_monitor is not None and global_monitor.running:
+            self._subscribed_to = global_monitor
+            global_monitor.subscribe(self._on_stats)
+            return
+        
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
     
     def stop_monitoring(self) -> None:
         """Stop background monitoring"""
         self.monitoring = False
+        if self._subscribed_to is not None:
+            self._subscribed_to.unsubscribe(self._on_stats)
+            self._subscribed_to = None
         if self.monitor_thread and self.monitor_thread.is_alive():
             self.monitor_thread.join(timeout=2.0)
     
+    def _on_stats(self, gpu_stats: Optional[GPUStats], system_stats: Optional[SystemStats]) -> None:
+        """Receive readings from the global continuous monitor"""
+        self._snapshot = (gpu_stats, system_stats)
+    
     def _monitor_loop(self) -> None:
         """Main monitoring loop running in background thread"""
+        deadline = time.monotonic()
         while self.monitoring:
             try:
-                # Collect stats
-                gpu_stats = get_gpu_stats() if self.gpu_available else None
-                system_stats = get_system_stats() if self.system_available else None
+                # Collect stats (cached readings older than half an
+                # interval are never reused as a new tick)
+                max_age = self.update_interval / 2
+                gpu_stats = get_gpu_stats(max_age=max_age) if self.gpu_available else None
+                system_stats = get_system_stats(max_age) if self.system_available else None
                 
-                # Thread-safe update
-                with self.lock:
-                    self.gpu_stats = gpu_stats
-                    self.system_stats = system_stats
-                
-                # Sleep until next update
-                time.sleep(self.update_interval)
+                # Publish with a single (atomic) reference assignment
+                self._snapshot = (gpu_stats, system_stats)
                 
             except Exception:
                 # Continue monitoring even if individual collection fails
-                time.sleep(self.update_interval)
+                pass
+            
+            # Sleep until next update
+            deadline = _sleep_until_next_tick(deadline, self.update_interval)
     
     def get_current_stats(self) -> Tuple[Optional[GPUStats], Optional[SystemStats]]:
         """
@@ -322,8 +728,7 @@ class ResourceMonitor:
         Returns:
             Tuple of (gpu_stats, system_stats) or (None, None) if not available
         """
-        with self.lock:
-            return self.gpu_stats, self.system_stats
+        return self._snapshot
     
     def get_stats_dict(self) -> Dict[str, Any]:
         """
@@ -334,27 +739,34 @@ class ResourceMonitor:
         """
         gpu_stats, system_stats = self.get_current_stats()
         
-        result = {
+        return {
             "timestamp": time.time(),
-            "gpu": {
-                "available": gpu_stats.available if gpu_stats else False,
-                "utilization": gpu_stats.utilization if gpu_stats else 0,
-                "memory_used": gpu_stats.memory_used if gpu_stats else 0,
-                "memory_total": gpu_stats.memory_total if gpu_stats else 0,
-                "memory_percent": gpu_stats.memory_percent if gpu_stats else 0.0,
-                "temperature": gpu_stats.temperature if gpu_stats else 0,
-                "power_draw": gpu_stats.power_draw if gpu_stats else 0,
-            },
-            "system": {
-                "available": system_stats.available if system_stats else False,
-                "cpu_percent": system_stats.cpu_percent if system_stats else 0.0,
-                "ram_used": system_stats.ram_used if system_stats else 0,
-                "ram_total": system_stats.ram_total if system_stats else 0,
-                "ram_percent": system_stats.ram_percent if system_stats else 0.0,
-            }
+            "gpu": gpu_payload(gpu_stats),
+            "system": system_payload(system_stats),
         }
+
+
+def _sleep_until_next_tick(deadline: float, interval: float) -> float:
+    """
+    Sleep until the next tick of a fixed-rate loop
+    
+    Ticks are anchored to a monotonic deadline so the time spent collecting
+    stats does not stretch the period; if the loop has fallen behind, the
+    schedule restarts from now instead of firing a burst of catch-up ticks.
+    
+    Args:
+        deadline: Deadline of the tick that just ran
+        interval: Loop period in seconds
         
-        return result
+    Returns:
+        Deadline of the next tick
+    """
+    deadline += interval
+    delay = deadline - time.monotonic()
+    if delay > 0:
+        time.sleep(delay)
+        return deadline
+    return time.monotonic()
 
 
 def validate_update_interval(interval: float) -> None:
@@ -365,15 +777,19 @@ def validate_update_interval(interval: float) -> None:
         interval: Update interval in seconds
         
     Raises:
-        ValueError: If interval is out of valid range
+        ValueError: If interval is not a number (including NaN) or is out
+            of valid range
     """
-    if not isinstance(interval, (int, float)):
-        raise ValueError(f"Update interval must be a number, got {type(interval).__name__}")
-    
-    if interval < 0.1:
-        raise ValueError(f"Update interval too small: {interval}s (minimum: 0.1s)")
+    try:
+        in_range = 0.1 <= interval <= 60.0
+    except TypeError:
+        raise ValueError(f"Update interval must be a number, got {type(interval).__name__}") from None
     
-    if interval > 60.0:
+    if not in_range:
+        if interval != interval:
+            raise ValueError("Update interval must be a number, got NaN")
+        if interval < 0.1:
+            raise ValueError(f"Update interval too small: {interval}s (minimum: 0.1s)")
         raise ValueError(f"Update interval too large: {interval}s (maximum: 60s)")
 
 
@@ -412,112 +828,211 @@ class NodeResourceTracker:
     """
     
     def __init__(self):
-        self.current_node_id: Optional[str] = None
+        # (node_id, metrics) of the node being sampled, swapped as one
+        # reference so the monitor thread can read it without the lock
+        self._current: Optional[Tuple[str, NodeResourceMetrics]] = None
         self.active_nodes: Dict[str, NodeResourceMetrics] = {}
-        self.completed_nodes: Dict[str, NodeResourceMetrics] = {}
+        # Ordered oldest to newest completion
+        self.completed_nodes: "OrderedDict[str, NodeResourceMetrics]" = OrderedDict()
         self.lock = threading.Lock()
         
         # For tracking resource baselines
         self.baseline_stats = None
+        
+        # Serialized recent metrics, rebuilt only after completed_nodes changes
+        self._recent_cache: Optional[list] = None
+        self._recent_limit = 0
+        self._recent_dirty = True
+        
+        # Aggregates of the last MAX_COMPLETED_NODES completions, one flat
+        # array per field so summaries don't walk the metrics objects
+        self._agg_duration_ms = array('d', [0.0]) * MAX_COMPLETED_NODES
+        self._agg_avg_cpu = array('d', [0.0]) * MAX_COMPLETED_NODES
+        self._agg_avg_gpu = array('d', [0.0]) * MAX_COMPLETED_NODES
+        self._agg_peak_vram = array('d', [0.0]) * MAX_COMPLETED_NODES
+        self._agg_pos = 0
+        self._agg_count = 0
+    
+    @property
+    def current_node_id(self) -> Optional[str]:
+        """ID of the node currently being sampled"""
+        current = self._current
+        return current[0] if current else None
     
     def start_node_tracking(self, node_id: str, node_type: str = "", node_title: str = ""):
         """Start tracking resources for a specific node"""
         with self.lock:
-            self.current_node_id = node_id
-            
             # Create metrics object for this node
             metrics = NodeResourceMetrics(
                 node_id=node_id,
                 node_type=node_type,
                 node_title=node_title,
-                start_time=time.time()
+                start_time=time.time(),
+                start_ns=time.perf_counter_ns()
             )
             
             self.active_nodes[node_id] = metrics
+            self._current = (node_id, metrics)
             
             # Store baseline for calculating deltas
             self.baseline_stats = self._get_current_stats()
             
-            print(f"[KikoStats] Started tracking node: {node_id} ({node_type})")
+            logger.debug("Started tracking node: %s (%s)", node_id, node_type)
     
-    def stop_node_tracking(self, node_id: str):
-        """Stop tracking and finalize metrics for a node"""
+    def stop_node_tracking(self, node_id: str, dur_ns: Optional[int] = None):
+        """
+        Stop tracking and finalize metrics for a node
+        
+        Args:
+            node_id: Node being finalized
+            dur_ns: Duration measured by the caller in nanoseconds; measured
+                from start_node_tracking when omitted
+        """
         with self.lock:
             if node_id in self.active_nodes:
                 metrics = self.active_nodes[node_id]
+                
+                # Stop sampling before finalizing
+                current = self._current
+                if current and current[0] == node_id:
+                    self._current = None
+                
                 metrics.end_time = time.time()
+                if dur_ns is None:
+                    dur_ns = time.perf_counter_ns() - metrics.start_ns
+                metrics.duration_ns = dur_ns
                 
                 # Calculate aggregate metrics
                 metrics.calculate_aggregates()
+                self._record_aggregates(metrics)
                 
-                # Move to completed
+                # Move to completed (re-executed nodes become the newest entry)
                 self.completed_nodes[node_id] = metrics
+                self.completed_nodes.move_to_end(node_id)
                 del self.active_nodes[node_id]
+                self._trim_completed(MAX_COMPLETED_NODES)
+                self._recent_dirty = True
                 
-                # Clear current tracking
-                if self.current_node_id == node_id:
-                    self.current_node_id = None
-                
-                print(f"[KikoStats] Completed tracking node: {node_id} "
-                      f"(Duration: {metrics.duration_ms:.1f}ms, "
-                      f"Avg CPU: {metrics.avg_cpu_percent:.1f}%, "
-                      f"Avg GPU: {metrics.avg_gpu_utilization:.1f}%)")
+                logger.debug("Completed tracking node: %s "
+                             "(Duration: %.1fms, Avg CPU: %.1f%%, Avg GPU: %.1f%%)",
+                             node_id, metrics.duration_ms,
+                             metrics.avg_cpu_percent, metrics.avg_gpu_utilization)
                 
                 return metrics
         
         return None
     
-    def sample_current_node(self, gpu_stats: Optional[GPUStats], system_stats: Optional[SystemStats]):
-        """Sample resources for the currently tracking node"""
-        with self.lock:
-            if not self.current_node_id or self.current_node_id not in self.active_nodes:
-                return
-            
-            # Create sample
-            sample = NodeResourceSample(
-                timestamp=time.time(),
-                cpu_percent=system_stats.cpu_percent if system_stats else 0.0,
-                gpu_utilization=gpu_stats.utilization if gpu_stats else 0,
-                gpu_memory_used=gpu_stats.memory_used if gpu_stats else 0,
-                vram_delta=0  # Will be calculated later
-            )
-            
-            # Add to current node's samples
-            self.active_nodes[self.current_node_id].samples.append(sample)
+    def sample_current_node(
+        self,
+        gpu_stats: Optional[GPUStats],
+        system_stats: Optional[SystemStats],
+        ts: Optional[float] = None
+    ):
+        """
+        Sample resources for the currently tracking node
+        
+        ``ts`` is the wall-clock time of the monitor tick the readings belong
+        to, so samples line up with the published snapshot timestamp.
+        
+        Runs on the monitor thread without taking the tracker lock: the
+        current node is read through one atomic reference, only this thread
+        adds samples, and each sample replaces the node's running totals in
+        one assignment. A sample racing with stop_node_tracking() either
+        lands before the totals are read or is dropped; it never leaves the
+        finalized aggregates half-updated.
+        """
+        current = self._current
+        if current is None:
+            return
+        
+        # Create sample
+        sample = NodeResourceSample(
+            timestamp=ts if ts is not None else time.time(),
+            cpu_percent=system_stats.cpu_percent if system_stats else 0.0,
+            gpu_utilization=gpu_stats.utilization if gpu_stats else 0,
+            gpu_memory_used=gpu_stats.memory_used if gpu_stats else 0,
+            vram_delta=0  # Will be calculated later
+        )
+        
+        # Add to current node's samples
+        current[1].add_sample(sample)
     
     def get_recent_node_metrics(self, limit: int = 10) -> list:
-        """Get recent completed node metrics"""
+        """
+        Get recent completed node metrics
+        
+        The list is cached until the completed nodes change, so the same
+        object is returned on repeated calls and must not be mutated.
+        """
         with self.lock:
-            # Get most recent completed nodes
-            recent = list(self.completed_nodes.values())[-limit:]
+            if self._recent_dirty or limit != self._recent_limit:
+                # Get most recent completed nodes (oldest first)
+                recent = list(islice(reversed(self.completed_nodes.values()), limit))
+                recent.reverse()
+                
+                # Convert to dictionaries for JSON serialization
+                self._recent_cache = [m.to_dict() for m in recent]
+                self._recent_limit = limit
+                self._recent_dirty = False
             
-            # Convert to dictionaries for JSON serialization
-            return [
-                {
-                    'node_id': m.node_id,
-                    'node_type': m.node_type,
-                    'node_title': m.node_title,
-                    'duration_ms': m.duration_ms,
-                    'avg_cpu_percent': m.avg_cpu_percent,
-                    'max_cpu_percent': m.max_cpu_percent,
-                    'avg_gpu_utilization': m.avg_gpu_utilization,
-                    'max_gpu_utilization': m.max_gpu_utilization,
-                    'peak_vram_used': m.peak_vram_used,
-                    'vram_delta': m.vram_delta,
-                    'sample_count': len(m.samples)
-                }
-                for m in recent
-            ]
+            return self._recent_cache
     
     def clear_old_metrics(self, keep_count: int = 50):
         """Clear old completed metrics to prevent memory buildup"""
         with self.lock:
-            if len(self.completed_nodes) > keep_count:
-                # Keep only the most recent entries
-                sorted_items = sorted(self.completed_nodes.items(), 
-                                    key=lambda x: x[1].end_time)
-                to_keep = dict(sorted_items[-keep_count:])
-                self.completed_nodes = to_keep
+            if self._trim_completed(keep_count):
+                self._recent_dirty = True
+    
+    def _trim_completed(self, keep_count: int) -> bool:
+        """Drop the oldest completed metrics beyond keep_count (lock held)"""
+        if len(self.completed_nodes) <= keep_count:
+            return False
+        while len(self.completed_nodes) > keep_count:
+            self.completed_nodes.popitem(last=False)
+        return True
+    
+    def _record_aggregates(self, metrics: NodeResourceMetrics) -> None:
+        """Write a completed node's aggregates into the ring slot (lock held)"""
+        pos = self._agg_pos
+        self._agg_duration_ms[pos] = metrics.duration_ms
+        self._agg_avg_cpu[pos] = metrics.avg_cpu_percent
+        self._agg_avg_gpu[pos] = metrics.avg_gpu_utilization
+        self._agg_peak_vram[pos] = metrics.peak_vram_used
+        self._agg_pos = (pos + 1) % MAX_COMPLETED_NODES
+        if self._agg_count < MAX_COMPLETED_NODES:
+            self._agg_count += 1
+    
+    def get_stats_summary(self) -> Dict[str, Any]:
+        """
+        Summarize the last completed node executions
+        
+        Returns:
+            Dictionary with the number of executions covered, the mean/max
+            of their durations and of their per-node average CPU/GPU usage,
+            and the highest peak VRAM
+        """
+        with self.lock:
+            count = self._agg_count
+            if count == 0:
+                return {"count": 0}
+            
+            # Slots past count are still zero until the ring first fills
+            duration_ms = self._agg_duration_ms[:count]
+            avg_cpu = self._agg_avg_cpu[:count]
+            avg_gpu = self._agg_avg_gpu[:count]
+            peak_vram = self._agg_peak_vram[:count]
+        
+        return {
+            "count": count,
+            "mean_duration_ms": sum(duration_ms) / count,
+            "max_duration_ms": max(duration_ms),
+            "total_duration_ms": sum(duration_ms),
+            "mean_cpu_percent": sum(avg_cpu) / count,
+            "max_avg_cpu_percent": max(avg_cpu),
+            "mean_gpu_utilization": sum(avg_gpu) / count,
+            "max_avg_gpu_utilization": max(avg_gpu),
+            "max_peak_vram_used": int(max(peak_vram)),
+        }
     
     def _get_current_stats(self) -> Dict[str, Any]:
         """Get current system stats for baseline calculations"""
@@ -547,25 +1062,34 @@ class ContinuousResourceMonitor:
         self.update_interval = update_interval
         self.running = False
         self.thread = None
-        self.lock = threading.Lock()
         
-        # Latest stats cache
+        # Latest stats cache; replaced wholesale each tick so reads and
+        # writes are single reference operations and need no lock
         self.latest_stats = None
         
+        # Raw (timestamp, gpu_stats, system_stats) from the last tick, and
+        # whether latest_stats still needs rebuilding from it
+        self._latest_raw: Optional[Tuple[float, Optional[GPUStats], Optional[SystemStats]]] = None
+        self._stats_stale = False
+        
+        # Incremented for every new set of readings; lets readers tell
+        # whether anything changed without touching the snapshot
+        self.version = 0
+        
+        # (snapshot, JSON) for the snapshot last encoded by get_latest_json(),
+        # per indent setting; each entry is replaced as one reference
+        self._latest_json: Dict[bool, Tuple[Dict[str, Any], str]] = {}
+        
+        # Callbacks receiving (gpu_stats, system_stats) every tick; replaced
+        # copy-on-write so the monitor loop can iterate without a lock
+        self._subscribers: Tuple[Callable[[Optional[GPUStats], Optional[SystemStats]], None], ...] = ()
+        self._subscribers_lock = threading.Lock()
+        
         # Node tracking
         self.node_tracker = NodeResourceTracker()
         
         # Initialize monitoring capabilities
-        self.gpu_available = initialize_gpu_monitoring()
-        self.system_available = PSUTIL_AVAILABLE
-        
-        # Initialize CPU monitoring baseline
-        if self.system_available:
-            try:
-                # Prime CPU monitoring with first call
-                psutil.cpu_percent(interval=None)
-            except Exception:
-                pass
+        self.gpu_available, self.system_available = init_monitoring_backends()
     
     def start_monitoring(self):
         """Start continuous background monitoring"""
@@ -575,82 +1099,150 @@ class ContinuousResourceMonitor:
         self.running = True
         self.thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.thread.start()
-        print(f"[KikoStats] Started continuous monitoring (interval: {self.update_interval}s)")
+        logger.info("Started continuous monitoring (interval: %ss)", self.update_interval)
     
     def stop_monitoring(self):
         """Stop background monitoring"""
         self.running = False
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=2.0)
-        print("[KikoStats] Stopped continuous monitoring")
+        logger.info("Stopped continuous monitoring")
     
     def _monitor_loop(self):
         """Main monitoring loop - runs continuously in background"""
+        deadline = time.monotonic()
+        error_streak = 0
         while self.running:
             try:
-                # Collect fresh stats
-                gpu_stats = get_gpu_stats() if self.gpu_available else None
-                system_stats = get_system_stats() if self.system_available else None
+                # Collect fresh stats (cached readings older than half an
+                # interval are never reused as a new tick)
+                max_age = self.update_interval / 2
+                gpu_stats = get_gpu_stats(max_age=max_age) if self.gpu_available else None
+                system_stats = get_system_stats(max_age) if self.system_available else None
+                
+                # One wall-clock stamp per tick, shared by the node sample
+                # and the published snapshot
+                now = time.time()
                 
                 # Sample current node if tracking
-                self.node_tracker.sample_current_node(gpu_stats, system_stats)
+                self.node_tracker.sample_current_node(gpu_stats, system_stats, now)
                 
-                # Create stats dictionary
-                stats_dict = {
-                    "timestamp": time.time(),
-                    "gpu": {
-                        "available": gpu_stats.available if gpu_stats else False,
-                        "utilization": gpu_stats.utilization if gpu_stats else 0,
-                        "memory_used": gpu_stats.memory_used if gpu_stats else 0,
-                        "memory_total": gpu_stats.memory_total if gpu_stats else 0,
-                        "memory_percent": gpu_stats.memory_percent if gpu_stats else 0.0,
-                        "temperature": gpu_stats.temperature if gpu_stats else 0,
-                        "power_draw": gpu_stats.power_draw if gpu_stats else 0,
-                    },
-                    "system": {
-                        "available": system_stats.available if system_stats else False,
-                        "cpu_percent": system_stats.cpu_percent if system_stats else 0.0,
-                        "ram_used": system_stats.ram_used if system_stats else 0,
-                        "ram_total": system_stats.ram_total if system_stats else 0,
-                        "ram_percent": system_stats.ram_percent if system_stats else 0.0,
-                    },
-                    "nodes": self.node_tracker.get_recent_node_metrics(limit=10)
-                }
+                # Keep the raw readings; the payload dict is only built when
+                # someone is listening or get_latest_stats() asks for it
+                self._latest_raw = (now, gpu_stats, system_stats)
+                self._stats_stale = True
+                self.version += 1
                 
-                # Thread-safe update
-                with self.lock:
-                    self.latest_stats = stats_dict
+                # Share the readings with subscribed monitors
+                for callback in self._subscribers:
+                    try:
+                        callback(gpu_stats, system_stats)
+                    except Exception:
+                        pass
                 
                 # Check for node tracking commands from JavaScript
                 self._process_js_tracking_commands()
                 
                 # Send real-time data via WebSocket (like Crystools)
-                if COMFYUI_SERVER_AVAILABLE and PromptServer.instance:
+                if _has_listeners():
+                    stats_dict = self._publish_latest_stats()
                     try:
                         PromptServer.instance.send_sync('kikostats.monitor', stats_dict)
                     except Exception as e:
                         # Don't let WebSocket errors stop monitoring
                         pass
                 
-                # Sleep until next update
-                time.sleep(self.update_interval)
+                error_streak = 0
                 
-            except Exception as e:
-                # Continue monitoring even if individual collection fails
-                print(f"[KikoStats] Monitoring error: {e}")
-                time.sleep(self.update_interval)
+            except Exception:
+                # Continue monitoring even if individual collection fails,
+                # but don't flood the log with a persistent failure
+                error_streak += 1
+                if error_streak <= MAX_LOGGED_MONITOR_ERRORS:
+                    logger.exception("Monitoring error")
+                    if error_streak == MAX_LOGGED_MONITOR_ERRORS:
+                        logger.warning("Suppressing further monitoring errors until a tick succeeds")
+            
+            # Sleep until next update
+            deadline = _sleep_until_next_tick(deadline, self.update_interval)
+    
+    def subscribe(
+        self, callback: Callable[[Optional[GPUStats], Optional[SystemStats]], None]
+    ) -> None:
+        """
+        Receive (gpu_stats, system_stats) after every monitoring tick
+        
+        The callback is invoked immediately with the latest readings (if any)
+        and then from the monitor thread, so it must be quick.
+        """
+        with self._subscribers_lock:
+            self._subscribers = self._subscribers + (callback,)
+        
+        latest_raw = self._latest_raw
+        if latest_raw is not None:
+            callback(latest_raw[1], latest_raw[2])
+    
+    def unsubscribe(
+        self, callback: Callable[[Optional[GPUStats], Optional[SystemStats]], None]
+    ) -> None:
+        """Stop delivering readings to a callback registered with subscribe()"""
+        with self._subscribers_lock:
+            self._subscribers = tuple(cb for cb in self._subscribers if cb != callback)
+    
+    def _build_stats_dict(
+        self, timestamp: float, gpu_stats: Optional[GPUStats], system_stats: Optional[SystemStats]
+    ) -> Dict[str, Any]:
+        """Build the JSON-serializable stats payload for one tick"""
+        return {
+            "timestamp": timestamp,
+            "gpu": gpu_payload(gpu_stats),
+            "system": system_payload(system_stats),
+            "nodes": self.node_tracker.get_recent_node_metrics(limit=10)
+        }
+    
+    def _publish_latest_stats(self) -> Optional[Dict[str, Any]]:
+        """Rebuild latest_stats from the last raw readings if they are newer"""
+        if self._stats_stale:
+            self._stats_stale = False
+            self.latest_stats = self._build_stats_dict(*self._latest_raw)
+        return self.latest_stats
     
     def get_latest_stats(self) -> Optional[Dict[str, Any]]:
-        """Get the latest cached stats"""
-        with self.lock:
-            return self.latest_stats.copy() if self.latest_stats else None
+        """
+        Get the latest cached stats
+        
+        Returns the published snapshot itself (not a copy); it is shared by
+        all readers and must not be mutated.
+        """
+        return self._publish_latest_stats()
+    
+    def get_latest_json(self, indent: bool = True) -> Optional[str]:
+        """
+        Get the latest stats encoded as JSON
+        
+        Each snapshot is encoded at most once per indent setting, on first
+        request, and the string is shared by every caller until the next
+        snapshot.
+        
+        Args:
+            indent: Indented output (node JSON) or compact (event streams)
+        """
+        stats = self._publish_latest_stats()
+        if stats is None:
+            return None
+        
+        latest_json = self._latest_json.get(indent)
+        if latest_json is None or latest_json[0] is not stats:
+            latest_json = (stats, dumps_stats(stats, indent))
+            self._latest_json[indent] = latest_json
+        return latest_json[1]
     
     def start_node_tracking(self, node_id: str, node_type: str = "", node_title: str = ""):
         """Start tracking resources for a specific node"""
         self.node_tracker.start_node_tracking(node_id, node_type, node_title)
         
         # Send node start event via WebSocket
-        if COMFYUI_SERVER_AVAILABLE and PromptServer.instance:
+        if _has_listeners():
             try:
                 PromptServer.instance.send_sync('kikostats.node_start', {
                     'node_id': node_id,
@@ -661,28 +1253,16 @@ class ContinuousResourceMonitor:
             except Exception:
                 pass
     
-    def stop_node_tracking(self, node_id: str) -> Optional[Dict[str, Any]]:
+    def stop_node_tracking(self, node_id: str, dur_ns: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """Stop tracking and get final metrics for a node"""
-        metrics = self.node_tracker.stop_node_tracking(node_id)
+        metrics = self.node_tracker.stop_node_tracking(node_id, dur_ns)
         
         if metrics:
             # Convert to dict for WebSocket
-            metrics_dict = {
-                'node_id': metrics.node_id,
-                'node_type': metrics.node_type,
-                'node_title': metrics.node_title,
-                'duration_ms': metrics.duration_ms,
-                'avg_cpu_percent': metrics.avg_cpu_percent,
-                'max_cpu_percent': metrics.max_cpu_percent,
-                'avg_gpu_utilization': metrics.avg_gpu_utilization,
-                'max_gpu_utilization': metrics.max_gpu_utilization,
-                'peak_vram_used': metrics.peak_vram_used,
-                'vram_delta': metrics.vram_delta,
-                'sample_count': len(metrics.samples)
-            }
+            metrics_dict = metrics.to_dict()
             
             # Send node completion event via WebSocket
-            if COMFYUI_SERVER_AVAILABLE and PromptServer.instance:
+            if _has_listeners():
                 try:
                     PromptServer.instance.send_sync('kikostats.node_complete', metrics_dict)
                 except Exception:
@@ -696,13 +1276,14 @@ class ContinuousResourceMonitor:
         """Send workflow completion event with total execution time"""
         if COMFYUI_SERVER_AVAILABLE and PromptServer.instance:
             try:
-                PromptServer.instance.send_sync('kikostats.workflow_complete', {
-                    'total_execution_time': total_execution_time,
-                    'timestamp': time.time()
-                })
-                print(f"[KikoStats] Workflow completed in {total_execution_time:.2f}s")
+                if _has_listeners():
+                    PromptServer.instance.send_sync('kikostats.workflow_complete', {
+                        'total_execution_time': total_execution_time,
+                        'timestamp': time.time()
+                    })
+                logger.info("Workflow completed in %.2fs", total_execution_time)
             except Exception as e:
-                print(f"[KikoStats] Error sending workflow complete event: {e}")
+                logger.warning("Error sending workflow complete event: %s", e)
     
     def _process_js_tracking_commands(self):
         """Process node tracking commands from JavaScript frontend"""
@@ -711,6 +1292,14 @@ class ContinuousResourceMonitor:
         pass
 
 
+def _has_listeners() -> bool:
+    """Whether any ComfyUI WebSocket client is connected to receive events"""
+    if not (COMFYUI_SERVER_AVAILABLE and PromptServer.instance):
+        return False
+    # Assume listeners if this ComfyUI version doesn't expose its sockets
+    return bool(getattr(PromptServer.instance, 'sockets', True))
+
+
 # Global continuous monitor instance
 _global_monitor: Optional[ContinuousResourceMonitor] = None
 
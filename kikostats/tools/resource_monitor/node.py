@@ -3,12 +3,10 @@ Resource Monitor ComfyUI Node
 Provides ComfyUI interface for real-time GPU and system monitoring
 """
 
-import json
-import time
 from typing import Dict, Any, Tuple
 
 from ...base import ComfyAssetsBaseNode
-from .logic import get_global_monitor
+from .logic import dumps_stats, get_global_monitor, waiting_payload
 
 
 class ResourceMonitorNode(ComfyAssetsBaseNode):
@@ -38,10 +36,17 @@ class ResourceMonitorNode(ComfyAssetsBaseNode):
             "optional": {},
         }
     
+    # Outputs are reused until the continuous monitor's version changes
+    __slots__ = ("_cache_version", "_last_result")
+    
     RETURN_TYPES = ("STRING", "STRING")
     RETURN_NAMES = ("stats", "json_data")
     FUNCTION = "monitor_resources"
     
+    def __init__(self):
+        self._cache_version = -1
+        self._last_result: Tuple[str, str] = ("", "")
+    
     def monitor_resources(
         self,
     ) -> Tuple[str, str]:
@@ -55,37 +60,24 @@ class ResourceMonitorNode(ComfyAssetsBaseNode):
             # Get the global continuous monitor (starts automatically)
             continuous_monitor = get_global_monitor()
             
-            # Get latest stats from continuous monitoring
-            stats_dict = continuous_monitor.get_latest_stats()
+            # Nothing new since the last execution
+            version = continuous_monitor.version
+            if version == self._cache_version:
+                return self._last_result
             
-            # If no stats yet, return waiting message
-            if stats_dict is None:
-                waiting_stats = {
-                    "timestamp": time.time(),
-                    "gpu": {"available": False, "utilization": 0, "memory_used": 0, "memory_total": 0, "memory_percent": 0.0, "temperature": 0, "power_draw": 0},
-                    "system": {"available": False, "cpu_percent": 0.0, "ram_used": 0, "ram_total": 0, "ram_percent": 0.0}
-                }
-                stats_dict = waiting_stats
+            # Latest stats from continuous monitoring, already encoded once
+            # per snapshot by the monitor and shared by every node
+            json_data = continuous_monitor.get_latest_json()
             
-            # Return JSON data for the UI widget
-            json_data = json.dumps(stats_dict, indent=2)
+            # If no stats yet, return waiting message
+            if json_data is None:
+                return "", dumps_stats(waiting_payload())
             
             # Return empty string for stats (UI displays everything)
-            return "", json_data
+            self._cache_version = version
+            self._last_result = ("", json_data)
+            return self._last_result
             
         except Exception as e:
             error_msg = f"Failed to monitor resources: {str(e)}"
             self.handle_error(error_msg, e)
-    
-    
-    
-
-
-# Node class mappings for ComfyUI registration
-NODE_CLASS_MAPPINGS = {
-    "ResourceMonitor": ResourceMonitorNode,
-}
-
-NODE_DISPLAY_NAME_MAPPINGS = {
-    "ResourceMonitor": "Resource Monitor",
-}
\ No newline at end of file
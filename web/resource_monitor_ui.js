@@ -281,7 +281,10 @@ app.registerExtension({
         window.resourceMonitorNodes = window.resourceMonitorNodes || [];
         window.resourceMonitorNodes.push(this);
         // Registered ResourceMonitor node
-        
+
+        // Wake the backend monitor (it is started lazily on first request)
+        api.fetchApi("/kikostats/monitor").catch(() => {});
+
         // Initialize monitoring display
         this.monitoringActive = false;
         this.monitorData = null;